@@ -0,0 +1,60 @@
+import json
+import os
+
+# default config file, loaded by main.py if it exists (written by tune.py)
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
+COOLING_SCHEDULES = ("iteration", "progress")
+
+# SA and LNS knobs, the defaults are the values I tuned by hand on a few instances.
+DEFAULT_CONFIG = {
+    # simulated annealing acceptance
+    "temp": 100.0,
+    "cooling": 0.995,
+    "min_temp": 1e-3,
+    # "iteration": multiply the temperature by cooling after every iteration,
+    # "progress": go from temp to min_temp over the time limit (cooling is ignored)
+    "cooling_schedule": "iteration",
+    # destroy ratio bands (low, high); large instances destroy less
+    "large_instance_customers": 100,
+    "destroy_small": [0.10, 0.30],
+    "destroy_large": [0.05, 0.15],
+    # after this fraction of the time limit we switch to intensification
+    "final_phase": 0.75,
+    "destroy_final": [0.03, 0.08],
+    # repair / local search
+    "repair_top_k": 15,
+    "improve_top_k": 20,
+    "improve_passes": 1,
+    "final_improve_passes": 2,
+    "swap_budget": 1500,
+    "final_swap_budget": 3000,
+}
+
+
+# fill missing keys with defaults and reject unknown ones (probably typos).
+def make_config(overrides=None):
+    config = {k: (list(v) if isinstance(v, list) else v) for k, v in DEFAULT_CONFIG.items()}
+    if overrides:
+        unknown = set(overrides) - set(DEFAULT_CONFIG)
+        if unknown:
+            raise ValueError(f"Unknown config keys: {sorted(unknown)}")
+        config.update(overrides)
+    if config["cooling_schedule"] not in COOLING_SCHEDULES:
+        raise ValueError(f"Unknown cooling schedule: {config['cooling_schedule']}")
+    return config
+
+
+def load_config(file_path=CONFIG_PATH):
+    """
+    Loads the config from a JSON file. Returns the defaults if the file does not exist.
+    """
+    if not os.path.exists(file_path):
+        return make_config()
+    with open(file_path) as f:
+        return make_config(json.load(f))
+
+
+def save_config(config, file_path=CONFIG_PATH):
+    with open(file_path, 'w') as f:
+        json.dump(config, f, indent=3)
@@ -1,6 +1,8 @@
+import math
 import random
 import sys
 import os
+import time
 
 # let me import the helper modules from the parent folder
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -329,4 +331,142 @@ def is_infeasible(instance):
             return True
         bins[best_idx] -= d
 
-    return False
\ No newline at end of file
+    return False
+
+
+# LNS with simulated annealing acceptance, all knobs come from the config (see config.py).
+# runs until time_limit seconds have passed since start_time and returns the best solution found.
+# if max_iterations is given, it runs exactly that many iterations instead (and ignores the clock),
+# so a seeded run always gives the same result; the tuner uses this.
+def lns(solution, instance, config, start_time, time_limit, max_iterations=None):
+    # precompute sorted facility lists per customer once
+    facility_order = precompute_facility_order(instance)
+
+    current_solution = solution
+    current_cost = calculate_solution_cost(solution, instance)
+    best = current_solution.copy()
+    best_cost = current_cost
+
+    # SA parameters
+    start_temp = config["temp"]
+    cooling = config["cooling"]
+    min_temp = config["min_temp"]
+    progress_cooling = config["cooling_schedule"] == "progress"
+    temp = start_temp
+
+    no_customers = len(instance["customer_demands"])
+
+    iteration = 0
+    while True:
+        if max_iterations is not None:
+            if iteration >= max_iterations:
+                break
+            progress = iteration / max_iterations
+        else:
+            elapsed = time.time() - start_time
+            if elapsed >= time_limit:
+                break
+            progress = elapsed / max(1e-9, time_limit)
+        iteration += 1
+        final_phase = progress > config["final_phase"]
+
+        if progress_cooling:
+            # cool down geometrically from start_temp to min_temp over the run.
+            # this depends on progress, not on the iteration count, so the same schedule
+            # works for any time limit or machine speed.
+            temp = start_temp * (min_temp / start_temp) ** progress
+
+        # adapt destroy ratio: for larger instances, destroy less;
+        # near the end, destroy even less to intensify.
+        if no_customers >= config["large_instance_customers"]:
+            base_low, base_high = config["destroy_large"]
+        else:
+            base_low, base_high = config["destroy_small"]
+        if final_phase:
+            base_low, base_high = config["destroy_final"]
+
+        destroy_ratio = random.uniform(base_low, base_high)
+
+        # pick a destroy operator
+        destroy_op = random.choice([random_destroy, facility_destroy, expensive_destroy])
+
+        # apply the chosen destroy
+        if destroy_op is facility_destroy:
+            num_available = len(instance["facilities"])
+            num_facilities = max(1, int(destroy_ratio * num_available))
+            destroyed_solution = destroy_op(current_solution, instance, num_facilities=num_facilities)
+        elif destroy_op is expensive_destroy:
+            destroyed_solution = destroy_op(current_solution, instance, destroy_ratio)
+        else:
+            destroyed_solution = destroy_op(current_solution, destroy_ratio)
+
+        # temporary diversification: close some low-load facilities during repair
+        facility_count = [0] * len(instance["facilities"])
+        for fac in current_solution:
+            if fac is not None:
+                facility_count[fac] += 1
+        threshold = max(1, int(destroy_ratio * 5))
+        small_facilities = [i for i, cnt in enumerate(facility_count) if cnt <= threshold]
+
+        temp_closed = set()
+        if small_facilities:
+            num_to_close = int(len(small_facilities) * destroy_ratio)
+            if num_to_close <= 0 and random.random() < 0.2:
+                num_to_close = 1
+            num_to_close = min(len(small_facilities), max(0, num_to_close))
+            if num_to_close > 0:
+                temp_closed = set(random.sample(small_facilities, num_to_close))
+
+        # repair the partial solution (prefer using already-open facilities)
+        try:
+            repaired_solution = repair(
+                destroyed_solution, instance,
+                closed_facilities=temp_closed,
+                facility_order=facility_order,
+                top_k=config["repair_top_k"]
+            )
+        except Exception:
+            # if temporary closures make it infeasible, retry without them
+            repaired_solution = repair(
+                destroyed_solution, instance,
+                closed_facilities=None,
+                facility_order=facility_order,
+                top_k=config["repair_top_k"]
+            )
+
+        # increase polishing near the end
+        passes = config["final_improve_passes"] if final_phase else config["improve_passes"]
+        repaired_solution = local_improve(
+            repaired_solution, instance, facility_order,
+            max_passes=passes, top_k=config["improve_top_k"]
+        )
+
+        # try some random 2-swaps among expensive customers
+        swap_budget = config["final_swap_budget"] if final_phase else config["swap_budget"]
+        repaired_solution = swap_improve(repaired_solution, instance, budget=swap_budget)
+
+        new_cost = calculate_solution_cost(repaired_solution, instance)
+        delta = new_cost - current_cost
+
+        # decide whether to accept the new solution
+        accept = False
+        if new_cost < current_cost:
+            accept = True
+        else:
+            prob = math.exp(-max(0, delta) / max(min_temp, temp))
+            if random.random() < prob:
+                accept = True
+
+        if accept:
+            current_solution = repaired_solution.copy()
+            current_cost = new_cost
+
+        if new_cost < best_cost:
+            best = repaired_solution.copy()
+            best_cost = new_cost
+
+        # cool down the temperature
+        if not progress_cooling:
+            temp = max(min_temp, temp * cooling)
+
+    return best
@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from solver_template.tune import mean_ranks, race
+
+
+class MeanRanksTest(unittest.TestCase):
+    def test_ranks_with_ties(self):
+        # task 0: config 1 best, 0 and 2 tie -> ranks 2.5, 1, 2.5
+        # task 1: all tie -> everyone gets rank 2
+        results = {
+            (0, 0): 10, (1, 0): 5, (2, 0): 10,
+            (0, 1): 7, (1, 1): 7, (2, 1): 7,
+        }
+        ranks = mean_ranks(results, [0, 1, 2], [0, 1])
+        self.assertEqual(ranks, {0: 2.25, 1: 1.5, 2: 2.25})
+
+    def test_only_alive_configs_are_ranked(self):
+        results = {(0, 0): 1, (1, 0): 2, (2, 0): 3}
+        self.assertEqual(mean_ranks(results, [1, 2], [0]), {1: 1.0, 2: 2.0})
+
+
+class RaceTest(unittest.TestCase):
+    def run_race(self, num_configs, num_tasks, first_block, eta=2):
+        rounds = []
+
+        # lower config index is always better
+        def evaluate(jobs):
+            rounds.append(jobs)
+            return [c for c, t in jobs]
+
+        winner, rank = race([None] * num_configs, list(range(num_tasks)), evaluate, eta=eta, first_block=first_block,
+                            log=lambda line: None)
+        return winner, rank, rounds
+
+    def test_survivors_per_round(self):
+        winner, rank, rounds = self.run_race(num_configs=16, num_tasks=36, first_block=9)
+        alive = [sorted({c for c, t in jobs}) for jobs in rounds]
+        tasks = [sorted({t for c, t in jobs}) for jobs in rounds]
+        self.assertEqual([len(a) for a in alive], [16, 8, 4])
+        self.assertEqual(alive[1], list(range(8)))
+        self.assertEqual(tasks, [list(range(0, 9)), list(range(9, 27)), list(range(27, 36))])
+        self.assertEqual((winner, rank), (0, 1.0))
+
+    def test_first_block_before_any_elimination(self):
+        # a too small remainder is merged into the first round, every task is used
+        winner, rank, rounds = self.run_race(num_configs=6, num_tasks=12, first_block=9)
+        self.assertEqual(len(rounds), 1)
+        self.assertEqual(len(rounds[0]), 6 * 12)
+        self.assertEqual(winner, 0)
+
+    def test_single_config_is_not_evaluated(self):
+        winner, rank, rounds = self.run_race(num_configs=1, num_tasks=9, first_block=9)
+        self.assertEqual((winner, rank, rounds), (0, None, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+import argparse
+import glob
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from cflp_validator.validator import calculate_solution_cost
+import solver_template.solution as solution_function
+from solver_template.config import CONFIG_PATH, COOLING_SCHEDULES, make_config, save_config
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
+
+
+def log_uniform(rng, low, high):
+    return math.exp(rng.uniform(math.log(low), math.log(high)))
+
+
+def sample_band(rng, low_range, width_range):
+    low = rng.uniform(*low_range)
+    return [round(low, 3), round(low + rng.uniform(*width_range), 3)]
+
+
+# draw a random configuration around the hand-tuned defaults.
+def sample_config(rng):
+    return make_config({
+        "temp": round(log_uniform(rng, 10.0, 1000.0), 2),
+        "cooling": round(rng.uniform(0.98, 0.999), 4),
+        "min_temp": round(log_uniform(rng, 1e-3, 10.0), 4),
+        "cooling_schedule": rng.choice(COOLING_SCHEDULES),
+        "large_instance_customers": rng.choice([70, 100, 150]),
+        "destroy_small": sample_band(rng, (0.05, 0.20), (0.05, 0.25)),
+        "destroy_large": sample_band(rng, (0.02, 0.10), (0.05, 0.15)),
+        "final_phase": round(rng.uniform(0.5, 0.95), 2),
+        "destroy_final": sample_band(rng, (0.01, 0.05), (0.02, 0.08)),
+        "repair_top_k": rng.randint(5, 30),
+        "improve_top_k": rng.randint(10, 40),
+        "improve_passes": rng.randint(1, 2),
+        "final_improve_passes": rng.randint(1, 3),
+        "swap_budget": rng.randint(500, 3000),
+        "final_swap_budget": rng.randint(1000, 6000),
+    })
+
+
+# one seeded solver run, executed in a worker process. returns the final cost.
+# with an iteration budget the run is reproducible, with a time limit it depends on the machine load.
+def run_config(config, instance_path, seed, time_scale, iterations=None):
+    random.seed(seed)
+    with open(instance_path) as f:
+        instance = json.load(f)
+    start_time = time.time()
+    time_limit = instance["timeout"] * time_scale
+    solution = solution_function.naive_feasible_solution(instance)
+    best = solution_function.lns(solution, instance, config, start_time, time_limit, max_iterations=iterations)
+    return calculate_solution_cost(best, instance)
+
+
+# rank configurations on every task (1 = best, ties share the average rank)
+# and return the mean rank per configuration, like the Friedman statistic in F-race.
+def mean_ranks(results, alive, tasks):
+    total = {c: 0.0 for c in alive}
+    for t in tasks:
+        costs = sorted(results[(c, t)] for c in alive)
+        for c in alive:
+            cost = results[(c, t)]
+            first = costs.index(cost)
+            last = len(costs) - 1 - costs[::-1].index(cost)
+            total[c] += (first + last) / 2 + 1
+    return {c: total[c] / len(tasks) for c in alive}
+
+
+def race(configs, tasks, evaluate, eta=2, first_block=1, log=print):
+    """
+    Successive halving over the configurations.
+    Each round runs the surviving configurations on a new block of (instance, seed) tasks,
+    ranks them on all tasks seen so far and keeps the best 1/eta of them.
+    The first block has first_block tasks (one run per instance, so nobody is dropped after a single run),
+    then the block size grows by eta every round, and the last round takes all the remaining tasks.
+    evaluate gets a list of (config_index, task_index) pairs and returns their costs,
+    log gets one progress line per round.
+    Returns the index of the winner and its mean rank.
+    """
+    alive = list(range(len(configs)))
+    results = {}
+    done = 0
+    first_block = max(1, first_block)
+    block = first_block
+
+    while done < len(tasks) and len(alive) > 1:
+        block = min(block, len(tasks) - done)
+        # don't leave a remainder smaller than the first block, give it to this round
+        if len(tasks) - done - block < first_block:
+            block = len(tasks) - done
+        new_tasks = range(done, done + block)
+        jobs = [(c, t) for c in alive for t in new_tasks]
+        results.update(zip(jobs, evaluate(jobs)))
+        done += block
+
+        ranks = mean_ranks(results, alive, range(done))
+        alive.sort(key=lambda c: ranks[c])
+        log(f"Round on {done}/{len(tasks)} tasks, {len(alive)} configs, "
+              f"best #{alive[0]} mean rank {ranks[alive[0]]:.2f}")
+        # eliminate the underperforming configurations
+        alive = alive[:max(1, math.ceil(len(alive) / eta))]
+        block *= eta
+
+    return alive[0], (ranks[alive[0]] if done else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune the LNS/SA parameters by racing configurations on the instances.")
+    parser.add_argument("--data", default=DATA_DIR, help="directory with the instance files")
+    parser.add_argument("--configs", type=int, default=16, help="number of configurations (the defaults included)")
+    parser.add_argument("--seeds", type=int, default=2, help="seeded runs per instance")
+    parser.add_argument("--time-scale", type=float, default=0.1, help="fraction of the instance timeout per run")
+    parser.add_argument("--iterations", type=int, default=None,
+                        help="run a fixed number of LNS iterations instead of a time limit (reproducible runs)")
+    # leave one core free so the timed runs are not slowed down by everything else on the machine
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                        help="number of worker processes (default: number of cores - 1)")
+    parser.add_argument("--eta", type=int, default=2, help="keep 1/eta of the configurations after each round")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the tuner itself")
+    parser.add_argument("--output", default=CONFIG_PATH, help="where to save the winning config")
+    args = parser.parse_args()
+    if args.configs < 1:
+        parser.error("--configs must be at least 1")
+    if args.seeds < 1:
+        parser.error("--seeds must be at least 1")
+    if args.time_scale <= 0:
+        parser.error("--time-scale must be positive")
+    if args.eta < 2:
+        parser.error("--eta must be at least 2")
+    if args.iterations is not None and args.iterations < 1:
+        parser.error("--iterations must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    rng = random.Random(args.seed)
+    # instance files only, skip the reference solutions (sol_*.json)
+    instances = sorted(glob.glob(os.path.join(args.data, "F*.json")))
+    if not instances:
+        raise Exception(f"No instances found in {args.data}")
+
+    # one shuffled pass over all instances per seed, so every block of len(instances) tasks covers each instance once
+    tasks = []
+    for _ in range(args.seeds):
+        order = instances[:]
+        rng.shuffle(order)
+        tasks += [(path, rng.randrange(2 ** 31)) for path in order]
+
+    # keep the current defaults in the race so we never end up with something worse
+    configs = [make_config()] + [sample_config(rng) for _ in range(args.configs - 1)]
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        def evaluate(jobs):
+            futures = [
+                pool.submit(run_config, configs[c], tasks[t][0], tasks[t][1], args.time_scale, args.iterations)
+                for c, t in jobs
+            ]
+            return [future.result() for future in futures]
+
+        winner, rank = race(configs, tasks, evaluate, eta=args.eta, first_block=len(instances))
+    print(f"Winner: config #{winner}" + (f" (mean rank {rank:.2f})" if rank is not None else ""))
+    print(json.dumps(configs[winner], indent=3))
+    save_config(configs[winner], args.output)
+    print("Saved to", args.output)
+
+
+if __name__ == "__main__":
+    main()